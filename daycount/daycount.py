@@ -1,17 +1,67 @@
-import calendar
+from __future__ import annotations
+from typing import Callable, TYPE_CHECKING
 import datetime
-import pytz
+import functools
 import numpy as np
-from pandas.tseries.holiday import AbstractHolidayCalendar, Holiday, nearest_workday, \
-    USMartinLutherKingJr, USPresidentsDay, GoodFriday, USMemorialDay, \
-    USLaborDay, USThanksgivingDay
-import pandas as pd
-from types import NoneType
+from zoneinfo import ZoneInfo
+
+# pandas is only needed by the trading_* functions, which import it on first
+# use. The first trading_* call in a process pays for that import plus building
+# the holiday calendar (~300ms). actual* / *Thirty360_T never touch pandas.
+if TYPE_CHECKING:
+    from pandas.tseries.holiday import AbstractHolidayCalendar
+
+''' HELPERS '''
+def _isLeap(year : int | np.ndarray) -> bool | np.ndarray:
+    '''
+    
+    Gregorian leap year test. Divisible by 4 and, for century years, also by
+    16 (ie. by 400). Bitwise operators are used so the same test applies 
+    elementwise to integer numpy arrays.
+
+    '''
+    return ((year & 3) == 0) & (((year % 25) != 0) | ((year & 15) == 0))
+
+# reciprocal divisors, per second (S) and per day (D) - multiplying is cheaper 
+# than dividing
+_SEC_PER_DAY = 86400.0
+_INV_360S = 1.0 / (360 * _SEC_PER_DAY)
+_INV_364S = 1.0 / (364 * _SEC_PER_DAY)
+_INV_365S = 1.0 / (365 * _SEC_PER_DAY)
+_INV_366S = 1.0 / (366 * _SEC_PER_DAY)
+_INV_360D = 1.0 / 360
+_INV_364D = 1.0 / 364
+_INV_365D = 1.0 / 365
+_INV_366D = 1.0 / 366
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def _daysInMonth(year : int, month : int) -> int:
+    return 29 if (month == 2) and _isLeap(year) else _DAYS_IN_MONTH[month - 1]
+
+def _leapDayInSpan(startYear : int, startMonth : int, startDay : int, 
+                   endYear : int, endMonth : int, endDay : int) -> bool:
+    '''
+    
+    Whether a Feb 29th (0000) falls within (start, end]. Only the first leap
+    day after the start needs checking, found arithmetically rather than by
+    searching every year in between.
+
+    '''
+    # first year whose Feb 29th could follow the start
+    year = startYear if (startMonth == 1) or (startMonth == 2 and startDay < 29) else startYear + 1
+
+    # advance to the next leap year (skipping non-leap centuries)
+    year += (-year) % 4
+    while not _isLeap(year):
+        year += 4
+
+    return (endYear, endMonth, endDay) >= (year, 2, 29)
 
 ''' ACTUAL METHODS'''
 def actual360_T(start : datetime.datetime, 
                 end : datetime.datetime, 
-                secs : bool = True):
+                secs : bool = True) -> float:
     '''
     
     Actual/360. Used in money markets for short-term lending of currencies, 
@@ -38,17 +88,20 @@ def actual360_T(start : datetime.datetime,
         fraction of a year.
 
     '''
+
+    # zero-length period
+    if end == start:
+        return 0.0
+
     if secs:
-        divisor = 360 * 24 * 60 * 60
-        return (end - start).total_seconds() / divisor
+        return (end - start).total_seconds() * _INV_360S
 
     else:
-        divisor = 360
-        return (end - start).days / divisor
+        return (end - start).days * _INV_360D
 
 def actual364_T(start : datetime.datetime, 
                 end : datetime.datetime, 
-                secs : bool = True):
+                secs : bool = True) -> float:
     '''
     
     Actual/364.
@@ -75,17 +128,19 @@ def actual364_T(start : datetime.datetime,
 
     '''
 
+    # zero-length period
+    if end == start:
+        return 0.0
+
     if secs:
-        divisor = 364 * 24 * 60 * 60
-        return (end - start).total_seconds() / divisor
+        return (end - start).total_seconds() * _INV_364S
 
     else:
-        divisor = 364
-        return (end - start).days / divisor
+        return (end - start).days * _INV_364D
 
 def actual365_T(start : datetime.datetime, 
                 end : datetime.datetime, 
-                secs : bool = True):
+                secs : bool = True) -> float:
     '''
     
     Actual/365 Fixed.
@@ -112,18 +167,20 @@ def actual365_T(start : datetime.datetime,
 
     '''
 
+    # zero-length period
+    if end == start:
+        return 0.0
+
     if secs:
-        divisor = 366 * 24 * 60 * 60
-        return (end - start).total_seconds() / divisor
+        return (end - start).total_seconds() * _INV_366S
 
     else:
-        divisor = 366
-        return (end - start).days / divisor
+        return (end - start).days * _INV_366D
 
 def actual365L_T(start : datetime.datetime, 
                  end : datetime.datetime, 
                  couponFreq : int, 
-                 secs : bool = True):
+                 secs : bool = True) -> float:
     '''
 
     Actual/365L.
@@ -153,35 +210,26 @@ def actual365L_T(start : datetime.datetime,
 
     '''
 
-    divisor = 365
+    # zero-length period
+    if end == start:
+        return 0.0
 
     if couponFreq != 1:
-        if calendar.isleap(end.year):
-            divisor = 366
+        leapYear = _isLeap(end.year)
     else:
-        for year in range(start.year, end.year + 1):
-            if ( start < (datetime.datetime(year, 3, 1) - datetime.timedelta(days=1)) ) and \
-                ( (datetime.datetime(year, 3, 1) - datetime.timedelta(days=1)) <= end):
-                
-                try:
-                    datetime.datetime(year, 2, 29)
-                    divisor = 366
-                    break
-
-                except ValueError as e:
-                    continue
+        leapYear = _leapDayInSpan(start.year, start.month, start.day, end.year, end.month, end.day)
 
     if secs:
-        return (end - start).total_seconds() / (divisor * 24 * 60 * 60)
+        return (end - start).total_seconds() * (_INV_366S if leapYear else _INV_365S)
     
     else:
-        return (end - start).days / divisor
+        return (end - start).days * (_INV_366D if leapYear else _INV_365D)
 
 def actualActualICMA_T(start : datetime.datetime, 
                        end : datetime.datetime, 
                        nextCoupon : datetime.datetime, 
                        couponFreq : int, 
-                       secs : bool = True):
+                       secs : bool = True) -> float:
     '''
     
     Actual/Actual ICMA. Used for US T-bonds and Notes (among other securities).
@@ -214,18 +262,19 @@ def actualActualICMA_T(start : datetime.datetime,
 
     '''
 
+    # zero-length period
+    if end == start:
+        return 0.0
+
+    # timedelta division is exact (integer microseconds), no total_seconds()
     if secs:
-        numerator = (end - start).total_seconds()
-        denominator = couponFreq * (nextCoupon - start).total_seconds()
+        return ((end - start) / (nextCoupon - start)) / couponFreq
     else:
-        numerator = (end - start).days
-        denominator = couponFreq * (nextCoupon - start).days
-
-    return numerator / denominator
+        return ((end - start).days / (nextCoupon - start).days) / couponFreq
 
 def actualActualISDA_T(start : datetime.datetime, 
                        end : datetime.datetime, 
-                       secs : bool = True):
+                       secs : bool = True) -> float:
     '''
     
     Actual/Actual ISDA.
@@ -252,40 +301,77 @@ def actualActualISDA_T(start : datetime.datetime,
 
     '''
 
-    total = 0
-    currentDate = start
-    
-    for year in range(start.year, end.year + 1):
-        
-        DIY = 366 if calendar.isleap(year) else 365
+    # zero-length period
+    if end == start:
+        return 0.0
+
+    # reciprocal of the start year's length
+    if secs:
+        startInverse = _INV_366S if _isLeap(start.year) else _INV_365S
+    else:
+        startInverse = _INV_366D if _isLeap(start.year) else _INV_365D
 
+    # same year, single partial period
+    if start.year == end.year:
         if secs:
-            divisor = DIY * 24 * 60 * 60
+            return (end - start).total_seconds() * startInverse
+        else:
+            return (end - start).days * startInverse
 
-            if year == end.year:
-                total += (end - currentDate).total_seconds() / divisor
+    # reversed across years (no whole or partial years between)
+    if start.year > end.year:
+        return 0.0
 
-            else:
-                newYear = datetime.datetime(year + 1, 1, 1, 0, 0, 0)
-                total += (newYear - currentDate).total_seconds() / divisor
-                currentDate = newYear
-        else:
-            divisor = DIY
+    # year boundaries on either side of the whole years between
+    if secs:
+        endInverse = _INV_366S if _isLeap(end.year) else _INV_365S
+    else:
+        endInverse = _INV_366D if _isLeap(end.year) else _INV_365D
+    startNewYear = datetime.datetime(start.year + 1, 1, 1, tzinfo=start.tzinfo)
+    endNewYear = datetime.datetime(end.year, 1, 1, tzinfo=end.tzinfo)
 
-            if year == end.year:
-                total += (end - currentDate).days / divisor
+    # every whole year contributes exactly 1 (DIY / DIY)
+    wholeYears = end.year - start.year - 1
 
-            else:
-                newYear = datetime.datetime(year + 1, 1, 1, 0, 0, 0)
-                total += (newYear - currentDate).days / divisor
-                currentDate = newYear
+    if secs:
+        head = (startNewYear - start).total_seconds() * startInverse
+        tail = (end - endNewYear).total_seconds() * endInverse
+    else:
+        head = (startNewYear - start).days * startInverse
+        tail = (end - endNewYear).days * endInverse
 
-    return total
+    return head + wholeYears + tail
 
 ''' 30/360 METHODS '''
+def _thirty360Core(startYear : int, startMonth : int, startDay : int, 
+                   startHour : int, startMinute : int, startSecond : int, 
+                   endYear : int, endMonth : int, endDay : int, 
+                   endHour : int, endMinute : int, endSecond : int, 
+                   secs : bool) -> float:
+    '''
+    
+    Shared 30/360 calculation. Each convention only differs in how it 
+    adjusts the start / end day of the month, which is done by the caller.
+    Takes plain integers (no datetimes), so the arithmetic stays in ints.
+
+    '''
+
+    days = (endYear - startYear) * 360 + (endMonth - startMonth) * 30 + (endDay - startDay)
+
+    if secs:
+        seconds = days * 24 * 60 * 60 + \
+                  (endHour - startHour) * 60 * 60 + \
+                  (endMinute - startMinute) * 60 + \
+                  (endSecond - startSecond)
+
+        return seconds * _INV_360S
+
+    else:
+        return days * _INV_360D
+
 def bbThirty360_T(start : datetime.datetime, 
                   end : datetime.datetime, 
-                  secs : bool = True):
+                  secs : bool = True) -> float:
     '''
 
     30/360 Bond Basis.
@@ -312,50 +398,29 @@ def bbThirty360_T(start : datetime.datetime,
 
     '''
 
-    startDay = min(start.day, 30)
-    
-    if startDay > 29:
-        endDay = min(end.day, 30)
-    else:
-        endDay = end.day
+    # zero-length period
+    if end == start:
+        return 0.0
+
+    startDay = start.day
+    endDay = end.day
 
-    if (end.day == 31) and ((start.day) == 30 or (start.day == 31)):
+    if (endDay == 31) and (startDay >= 30):
         endDay = 30
-    if start.day == 31:
+    if startDay == 31:
         startDay = 30
 
-    if secs:
-        divisor = 360 * 24 * 60 * 60
+    return _thirty360Core(start.year, start.month, startDay, start.hour, start.minute, start.second, 
+                          end.year, end.month, endDay, end.hour, end.minute, end.second, 
+                          secs)
 
-        years = (end.year - start.year) * 360 * 24 * 60 * 60
-        months = (end.month - start.month) * 30 * 24 * 60 * 60
-        days = (endDay - startDay) * 24 * 60 * 60
-        hours = (end.hour - start.hour) * 60 * 60
-        minutes = (end.minute - start.minute) * 60
-        seconds = (end.second - start.second)
-
-        return (years + months + days + hours + minutes + seconds) / divisor
-    
-    else:
-        divisor = 360
-
-        years = (end.year - start.year) * 360
-        months = (end.month - start.month) * 30
-        days = (endDay - startDay)
-        
-        return (years + months + days) / divisor
-
-def _lastFebDay(dateTime : datetime.datetime):
-    if dateTime.month == 2:
-        _, last_of_month = calendar.monthrange(dateTime.year, dateTime.month)
-        if dateTime.day == last_of_month:
-            return True
-    return False
+def _lastFebDay(dateTime : datetime.datetime) -> bool:
+    return (dateTime.month == 2) and (dateTime.day == 28 + _isLeap(dateTime.year))
 
 def usThirty360_T(start : datetime.datetime, 
                   end : datetime.datetime, 
                   eomPayments : bool, 
-                  secs : bool = True):
+                  secs : bool = True) -> float:
     '''
 
     30/360 US. Used for US Corporate bond and many US agency issues.
@@ -385,44 +450,30 @@ def usThirty360_T(start : datetime.datetime,
 
     '''
 
+    # zero-length period
+    if end == start:
+        return 0.0
+
     startDay = start.day
     endDay = end.day
     
-    if eomPayments:
-        if _lastFebDay(start) and _lastFebDay(end):
+    if eomPayments and _lastFebDay(start):
+        if _lastFebDay(end):
             endDay = 30
-        if _lastFebDay(start):
-            startDay = 30
+        startDay = 30
 
-    if (endDay == 31) and ((startDay) == 30 or (startDay == 31)):
+    if (endDay == 31) and (startDay >= 30):
         endDay = 30
     if startDay == 31:
         startDay = 30
 
-    if secs:
-        divisor = 360 * 24 * 60 * 60
-
-        years = (end.year - start.year) * 360 * 24 * 60 * 60
-        months = (end.month - start.month) * 30 * 24 * 60 * 60
-        days = (endDay - startDay) * 24 * 60 * 60
-        hours = (end.hour - start.hour) * 60 * 60
-        minutes = (end.minute - start.minute) * 60
-        seconds = (end.second - start.second)
-
-        return (years + months + days + hours + minutes + seconds) / divisor
-
-    else:
-        divisor = 360
-
-        years = (end.year - start.year) * 360
-        months = (end.month - start.month) * 30
-        days = (endDay - startDay)
-
-        return (years + months + days) / divisor
+    return _thirty360Core(start.year, start.month, startDay, start.hour, start.minute, start.second, 
+                          end.year, end.month, endDay, end.hour, end.minute, end.second, 
+                          secs)
 
 def euroThirty360_T(start : datetime.datetime, 
                     end : datetime.datetime, 
-                    secs : bool = True):
+                    secs : bool = True) -> float:
     '''
 
     30E/360.
@@ -449,40 +500,27 @@ def euroThirty360_T(start : datetime.datetime,
 
     '''
 
-    endDay = end.day
+    # zero-length period
+    if end == start:
+        return 0.0
+
     startDay = start.day
+    endDay = end.day
 
-    if end.day == 31:
+    if endDay == 31:
         endDay = 30
 
-    if start.day == 31:
+    if startDay == 31:
         startDay = 30
 
-    if secs:
-        divisor = 360 * 24 * 60 * 60
-
-        years = (end.year - start.year) * 360 * 24 * 60 * 60
-        months = (end.month - start.month) * 30 * 24 * 60 * 60
-        days = (endDay - startDay) * 24 * 60 * 60
-        hours = (end.hour - start.hour) * 60 * 60
-        minutes = (end.minute - start.minute) * 60
-        seconds = (end.second - start.second)
-
-        return (years + months + days + hours + minutes + seconds) / divisor
-    
-    else:
-        divisor = 360
-
-        years = (end.year - start.year) * 360
-        months = (end.month - start.month) * 30
-        days = (endDay - startDay)
-
-        return (years + months + days) / divisor
+    return _thirty360Core(start.year, start.month, startDay, start.hour, start.minute, start.second, 
+                          end.year, end.month, endDay, end.hour, end.minute, end.second, 
+                          secs)
 
 def euroISDAThirty360_T(start : datetime.datetime, 
                         end : datetime.datetime, 
                         endIsMaturity : bool, 
-                        secs : bool = True):
+                        secs : bool = True) -> float:
     '''
 
     30E/360 ISDA.
@@ -513,56 +551,689 @@ def euroISDAThirty360_T(start : datetime.datetime,
 
     '''
 
+    # zero-length period
+    if end == start:
+        return 0.0
+
     startDay = start.day
     endDay = end.day
 
-    _, lastOfMonth = calendar.monthrange(start.year, start.month)
-    if start.day == lastOfMonth:
+    if startDay == _daysInMonth(start.year, start.month):
         startDay = 30
 
-    _, lastOfMonth = calendar.monthrange(end.year, end.month)
-    if (end.day == lastOfMonth) and not (endIsMaturity and (end.month == 2)):
+    if (endDay == _daysInMonth(end.year, end.month)) and not (endIsMaturity and (end.month == 2)):
         endDay = 30
 
+    return _thirty360Core(start.year, start.month, startDay, start.hour, start.minute, start.second, 
+                          end.year, end.month, endDay, end.hour, end.minute, end.second, 
+                          secs)
+
+''' BATCH METHODS '''
+def _asDatetime64(dates : np.ndarray | list | datetime.datetime) -> np.ndarray:
+    '''
+    
+    Coerces datetime64 arrays (any unit), lists of datetimes, or single values
+    to a microsecond datetime64 array.
+
+    '''
+    return np.asarray(dates, dtype="datetime64[us]")
+
+def _dateFields(dates : np.ndarray) -> tuple:
+    '''
+    
+    Splits a datetime64 array into (year, month, day, second of day) integer
+    arrays - the array equivalent of a datetime's attributes.
+
+    '''
+    years = dates.astype("datetime64[Y]")
+    months = dates.astype("datetime64[M]")
+    days = dates.astype("datetime64[D]")
+
+    return (years.astype(np.int64) + 1970, 
+            (months - years).astype(np.int64) + 1, 
+            (days - months).astype(np.int64) + 1, 
+            (dates - days) // np.timedelta64(1, "s"))
+
+def _daysInMonthBatch(years : np.ndarray, months : np.ndarray | int) -> np.ndarray:
+    return np.take(_DAYS_IN_MONTH, months - 1) + ((months == 2) & _isLeap(years))
+
+def _elapsed(start : np.ndarray, end : np.ndarray, secs : bool) -> np.ndarray:
+    '''
+    
+    Array equivalent of `(end - start).total_seconds()` (secs=True) or 
+    `(end - start).days` (secs=False).
+
+    '''
+    if secs:
+        return (end - start) / np.timedelta64(1, "s")
+    else:
+        return (end - start) // np.timedelta64(1, "D")
+
+def _zeroLengthBatch(start : np.ndarray, end : np.ndarray, result : np.ndarray) -> np.ndarray:
+    '''
+    
+    Array equivalent of the scalar methods' zero-length period check, 
+    `result` with 0.0 wherever `start == end`.
+
+    '''
+    return np.where(start == end, 0.0, result)
+
+def actual360_T_batch(start : np.ndarray, 
+                      end : np.ndarray, 
+                      secs : bool = True) -> np.ndarray:
+    '''
+    
+    Vectorized `actual360_T()`.
+
+    
+    Parameters
+    ----------
+    `start` : np.ndarray
+        The "current" dates/times from the contracts' point of view 
+        (datetime64, any unit). A single value is broadcast against `end`.
+
+    `end` : np.ndarray
+        The expirations / settlements / maturities of the contracts 
+        (datetime64, any unit).
+
+    `secs` : bool
+        Whether to included seconds when calculating the contracts' tenors.
+
+    Returns
+    -------
+    `np.ndarray`
+        The length of time until each contract's expiration, expressed as a 
+        fraction of a year.
+
+    '''
+    start, end = _asDatetime64(start), _asDatetime64(end)
+
+    if secs:
+        result = _elapsed(start, end, secs) * _INV_360S
+    else:
+        result = _elapsed(start, end, secs) * _INV_360D
+
+    return _zeroLengthBatch(start, end, result)
+
+def actual364_T_batch(start : np.ndarray, 
+                      end : np.ndarray, 
+                      secs : bool = True) -> np.ndarray:
+    '''
+    
+    Vectorized `actual364_T()`.
+
+    
+    Parameters
+    ----------
+    `start` : np.ndarray
+        The "current" dates/times from the contracts' point of view 
+        (datetime64, any unit). A single value is broadcast against `end`.
+
+    `end` : np.ndarray
+        The expirations / settlements / maturities of the contracts 
+        (datetime64, any unit).
+
+    `secs` : bool
+        Whether to included seconds when calculating the contracts' tenors.
+
+    Returns
+    -------
+    `np.ndarray`
+        The length of time until each contract's expiration, expressed as a 
+        fraction of a year.
+
+    '''
+    start, end = _asDatetime64(start), _asDatetime64(end)
+
+    if secs:
+        result = _elapsed(start, end, secs) * _INV_364S
+    else:
+        result = _elapsed(start, end, secs) * _INV_364D
+
+    return _zeroLengthBatch(start, end, result)
+
+def actual365_T_batch(start : np.ndarray, 
+                      end : np.ndarray, 
+                      secs : bool = True) -> np.ndarray:
+    '''
+    
+    Vectorized `actual365_T()`.
+
+    
+    Parameters
+    ----------
+    `start` : np.ndarray
+        The "current" dates/times from the contracts' point of view 
+        (datetime64, any unit). A single value is broadcast against `end`.
+
+    `end` : np.ndarray
+        The expirations / settlements / maturities of the contracts 
+        (datetime64, any unit).
+
+    `secs` : bool
+        Whether to included seconds when calculating the contracts' tenors.
+
+    Returns
+    -------
+    `np.ndarray`
+        The length of time until each contract's expiration, expressed as a 
+        fraction of a year.
+
+    '''
+    start, end = _asDatetime64(start), _asDatetime64(end)
+
+    if secs:
+        result = _elapsed(start, end, secs) * _INV_366S
+    else:
+        result = _elapsed(start, end, secs) * _INV_366D
+
+    return _zeroLengthBatch(start, end, result)
+
+def actual365L_T_batch(start : np.ndarray, 
+                       end : np.ndarray, 
+                       couponFreq : int, 
+                       secs : bool = True) -> np.ndarray:
+    '''
+    
+    Vectorized `actual365L_T()`.
+
+    
+    Parameters
+    ----------
+    `start` : np.ndarray
+        The "current" dates/times from the contracts' point of view 
+        (datetime64, any unit). A single value is broadcast against `end`.
+
+    `end` : np.ndarray
+        The expirations / settlements / maturities of the contracts 
+        (datetime64, any unit).
+
+    `couponFreq` : int
+        Number of payments per year.
+
+    `secs` : bool
+        Whether to included seconds when calculating the contracts' tenors.
+
+    Returns
+    -------
+    `np.ndarray`
+        The length of time until each contract's expiration, expressed as a 
+        fraction of a year.
+
+    '''
+    start, end = _asDatetime64(start), _asDatetime64(end)
+    endYears = end.astype("datetime64[Y]").astype(np.int64) + 1970
+
+    if couponFreq != 1:
+        leapYear = _isLeap(endYears)
+    else:
+        # count of Feb 29ths falling in (start, end]
+        def leapDays(dates : np.ndarray, years : np.ndarray) -> np.ndarray:
+            n = years - 1
+            feb29 = (dates.astype("datetime64[Y]").astype("datetime64[M]") + 2).astype("datetime64[D]") - 1
+            return (n // 4 - n // 100 + n // 400) + (_isLeap(years) & (dates >= feb29))
+
+        startYears = start.astype("datetime64[Y]").astype(np.int64) + 1970
+        leapYear = leapDays(end, endYears) > leapDays(start, startYears)
+
+    if secs:
+        result = _elapsed(start, end, secs) * np.where(leapYear, _INV_366S, _INV_365S)
+    else:
+        result = _elapsed(start, end, secs) * np.where(leapYear, _INV_366D, _INV_365D)
+
+    return _zeroLengthBatch(start, end, result)
+
+def actualActualICMA_T_batch(start : np.ndarray, 
+                             end : np.ndarray, 
+                             nextCoupon : np.ndarray, 
+                             couponFreq : int | np.ndarray, 
+                             secs : bool = True) -> np.ndarray:
+    '''
+    
+    Vectorized `actualActualICMA_T()`.
+
+    
+    Parameters
+    ----------
+    `start` : np.ndarray
+        The "current" dates/times from the contracts' point of view 
+        (datetime64, any unit). A single value is broadcast against `end`.
+
+    `end` : np.ndarray
+        The expirations / settlements / maturities of the contracts 
+        (datetime64, any unit).
+
+    `nextCoupon` : np.ndarray
+        The dates/times of the next payments (datetime64, any unit).
+    
+    `couponFreq` : int | np.ndarray
+        Number of payments per year.
+
+    `secs` : bool
+        Whether to included seconds when calculating the contracts' tenors.
+
+    Returns
+    -------
+    `np.ndarray`
+        The length of time until each contract's expiration, expressed as a 
+        fraction of a year.
+
+    '''
+    start, end, nextCoupon = _asDatetime64(start), _asDatetime64(end), _asDatetime64(nextCoupon)
+
+    # 0/0 only occurs for zero-length periods (start == end == nextCoupon), 
+    # which are zeroed below
+    with np.errstate(invalid="ignore"):
+        if secs:
+            result = ((end - start) / (nextCoupon - start)) / couponFreq
+        else:
+            result = (_elapsed(start, end, secs) / _elapsed(start, nextCoupon, secs)) / couponFreq
+
+    return _zeroLengthBatch(start, end, result)
+
+def actualActualISDA_T_batch(start : np.ndarray, 
+                             end : np.ndarray, 
+                             secs : bool = True) -> np.ndarray:
+    '''
+    
+    Vectorized `actualActualISDA_T()`.
+
+    
+    Parameters
+    ----------
+    `start` : np.ndarray
+        The "current" dates/times from the contracts' point of view 
+        (datetime64, any unit). A single value is broadcast against `end`.
+
+    `end` : np.ndarray
+        The expirations / settlements / maturities of the contracts 
+        (datetime64, any unit).
+
+    `secs` : bool
+        Whether to included seconds when calculating the contracts' tenors.
+
+    Returns
+    -------
+    `np.ndarray`
+        The length of time until each contract's expiration, expressed as a 
+        fraction of a year.
+
+    '''
+    start, end = _asDatetime64(start), _asDatetime64(end)
+
+    startYears = start.astype("datetime64[Y]")
+    endYears = end.astype("datetime64[Y]")
+    startLeap = _isLeap(startYears.astype(np.int64) + 1970)
+    endLeap = _isLeap(endYears.astype(np.int64) + 1970)
 
     if secs:
-        divisor = 360 * 24 * 60 * 60
+        startInverse = np.where(startLeap, _INV_366S, _INV_365S)
+        endInverse = np.where(endLeap, _INV_366S, _INV_365S)
+    else:
+        startInverse = np.where(startLeap, _INV_366D, _INV_365D)
+        endInverse = np.where(endLeap, _INV_366D, _INV_365D)
+
+    # same year, single partial period / otherwise partial years either side
+    sameYear = _elapsed(start, end, secs) * startInverse
+    head = _elapsed(start, startYears + 1, secs) * startInverse
+    tail = _elapsed(endYears, end, secs) * endInverse
+    wholeYears = (endYears - startYears).astype(np.int64) - 1
+
+    # reversed across years contributes nothing (matches the scalar method)
+    acrossYears = np.where(startYears < endYears, head + wholeYears + tail, 0.0)
+
+    return _zeroLengthBatch(start, end, np.where(startYears == endYears, sameYear, acrossYears))
 
-        years = (end.year - start.year) * 360 * 24 * 60 * 60
-        months = (end.month - start.month) * 30 * 24 * 60 * 60
-        days = (endDay - startDay) * 24 * 60 * 60
-        hours = (end.hour - start.hour) * 60 * 60
-        minutes = (end.minute - start.minute) * 60
-        seconds = (end.second - start.second)
+def _thirty360CoreBatch(startFields : tuple, 
+                        endFields : tuple, 
+                        startDay : np.ndarray, 
+                        endDay : np.ndarray, 
+                        secs : bool) -> np.ndarray:
+    '''
+    
+    Array equivalent of `_thirty360Core()`, taking the `_dateFields()` of the
+    start / end dates.
+
+    '''
+    startYear, startMonth, _, startSecond = startFields
+    endYear, endMonth, _, endSecond = endFields
 
-        return (years + months + days + hours + minutes + seconds) / divisor
+    days = (endYear - startYear) * 360 + (endMonth - startMonth) * 30 + (endDay - startDay)
 
+    if secs:
+        return (days * 24 * 60 * 60 + (endSecond - startSecond)) * _INV_360S
     else:
-        divisor = 360
+        return days * _INV_360D
+
+def bbThirty360_T_batch(start : np.ndarray, 
+                        end : np.ndarray, 
+                        secs : bool = True) -> np.ndarray:
+    '''
+    
+    Vectorized `bbThirty360_T()`.
 
-        years = (end.year - start.year) * 360
-        months = (end.month - start.month) * 30
-        days = (endDay - startDay)
+    
+    Parameters
+    ----------
+    `start` : np.ndarray
+        The "current" dates/times from the contracts' point of view 
+        (datetime64, any unit). A single value is broadcast against `end`.
 
-        return (years + months + days) / divisor
+    `end` : np.ndarray
+        The expirations / settlements / maturities of the contracts 
+        (datetime64, any unit).
+
+    `secs` : bool
+        Whether to included seconds when calculating the contracts' tenors.
+
+    Returns
+    -------
+    `np.ndarray`
+        The length of time until each contract's expiration, expressed as a 
+        fraction of a year.
+
+    '''
+    start, end = _asDatetime64(start), _asDatetime64(end)
+    startFields = _dateFields(start)
+    endFields = _dateFields(end)
+    startDay, endDay = startFields[2], endFields[2]
+
+    endDay = np.where((endDay == 31) & (startDay >= 30), 30, endDay)
+    startDay = np.minimum(startDay, 30)
+
+    return _zeroLengthBatch(start, end, _thirty360CoreBatch(startFields, endFields, startDay, endDay, secs))
+
+def usThirty360_T_batch(start : np.ndarray, 
+                        end : np.ndarray, 
+                        eomPayments : bool, 
+                        secs : bool = True) -> np.ndarray:
+    '''
+    
+    Vectorized `usThirty360_T()`.
+
+    
+    Parameters
+    ----------
+    `start` : np.ndarray
+        The "current" dates/times from the contracts' point of view 
+        (datetime64, any unit). A single value is broadcast against `end`.
+
+    `end` : np.ndarray
+        The expirations / settlements / maturities of the contracts 
+        (datetime64, any unit).
+
+    `eomPayments` : bool
+        Whether payments are received at the every end of the month.
+
+    `secs` : bool
+        Whether to included seconds when calculating the contracts' tenors.
+
+    Returns
+    -------
+    `np.ndarray`
+        The length of time until each contract's expiration, expressed as a 
+        fraction of a year.
+
+    '''
+    start, end = _asDatetime64(start), _asDatetime64(end)
+    startFields = _dateFields(start)
+    endFields = _dateFields(end)
+    startDay, endDay = startFields[2], endFields[2]
+
+    if eomPayments:
+        startLastFeb = (startFields[1] == 2) & (startDay == _daysInMonthBatch(startFields[0], 2))
+        endLastFeb = (endFields[1] == 2) & (endDay == _daysInMonthBatch(endFields[0], 2))
+
+        endDay = np.where(startLastFeb & endLastFeb, 30, endDay)
+        startDay = np.where(startLastFeb, 30, startDay)
+
+    endDay = np.where((endDay == 31) & (startDay >= 30), 30, endDay)
+    startDay = np.minimum(startDay, 30)
+
+    return _zeroLengthBatch(start, end, _thirty360CoreBatch(startFields, endFields, startDay, endDay, secs))
+
+def euroThirty360_T_batch(start : np.ndarray, 
+                          end : np.ndarray, 
+                          secs : bool = True) -> np.ndarray:
+    '''
+    
+    Vectorized `euroThirty360_T()`.
+
+    
+    Parameters
+    ----------
+    `start` : np.ndarray
+        The "current" dates/times from the contracts' point of view 
+        (datetime64, any unit). A single value is broadcast against `end`.
+
+    `end` : np.ndarray
+        The expirations / settlements / maturities of the contracts 
+        (datetime64, any unit).
+
+    `secs` : bool
+        Whether to included seconds when calculating the contracts' tenors.
+
+    Returns
+    -------
+    `np.ndarray`
+        The length of time until each contract's expiration, expressed as a 
+        fraction of a year.
+
+    '''
+    start, end = _asDatetime64(start), _asDatetime64(end)
+    startFields = _dateFields(start)
+    endFields = _dateFields(end)
+
+    startDay = np.minimum(startFields[2], 30)
+    endDay = np.minimum(endFields[2], 30)
+
+    return _zeroLengthBatch(start, end, _thirty360CoreBatch(startFields, endFields, startDay, endDay, secs))
+
+def euroISDAThirty360_T_batch(start : np.ndarray, 
+                              end : np.ndarray, 
+                              endIsMaturity : bool, 
+                              secs : bool = True) -> np.ndarray:
+    '''
+    
+    Vectorized `euroISDAThirty360_T()`.
+
+    
+    Parameters
+    ----------
+    `start` : np.ndarray
+        The "current" dates/times from the contracts' point of view 
+        (datetime64, any unit). A single value is broadcast against `end`.
+
+    `end` : np.ndarray
+        The expirations / settlements / maturities of the contracts 
+        (datetime64, any unit).
+
+    `endIsMaturity` : bool
+        Whether the expiration of the contracts are considered the maturity of 
+        the contracts.
+
+    `secs` : bool
+        Whether to included seconds when calculating the contracts' tenors.
+
+    Returns
+    -------
+    `np.ndarray`
+        The length of time until each contract's expiration, expressed as a 
+        fraction of a year.
+
+    '''
+    start, end = _asDatetime64(start), _asDatetime64(end)
+    startFields = _dateFields(start)
+    endFields = _dateFields(end)
+    startDay, endDay = startFields[2], endFields[2]
+
+    startDay = np.where(startDay == _daysInMonthBatch(startFields[0], startFields[1]), 30, startDay)
+
+    endLastOfMonth = endDay == _daysInMonthBatch(endFields[0], endFields[1])
+    if endIsMaturity:
+        endLastOfMonth &= (endFields[1] != 2)
+    endDay = np.where(endLastOfMonth, 30, endDay)
+
+    return _zeroLengthBatch(start, end, _thirty360CoreBatch(startFields, endFields, startDay, endDay, secs))
 
 ''' CUSTOM METHODS '''
-class USTradingCalendar(AbstractHolidayCalendar):
-    rules = [USMartinLutherKingJr,
-             USPresidentsDay,
-             GoodFriday,
-             USMemorialDay,
-             Holiday("Juneteenth", month=6, day=19),
-             Holiday('IndependenceDay', month=7, day=4, observance=nearest_workday),
-             #USLaborDay,
-             USThanksgivingDay,
-             Holiday('Christmas', month=12, day=25, observance=nearest_workday),
-             Holiday('NewYearsEve', month=1, day=1, observance=nearest_workday)]
+_CAL : AbstractHolidayCalendar | None = None
+
+def _getCal() -> AbstractHolidayCalendar:
+    '''
+    
+    The US trading holiday calendar, built (and pandas imported) on first use.
+    Built from rules rather than subclassed, so the module stays mypyc 
+    compilable (native classes can't inherit pandas' calendar metaclass).
+
+    '''
+    global _CAL
+
+    if _CAL is None:
+        from pandas.tseries.holiday import AbstractHolidayCalendar, Holiday, nearest_workday, \
+            USMartinLutherKingJr, USPresidentsDay, GoodFriday, USMemorialDay, \
+            USLaborDay, USThanksgivingDay
+
+        _CAL = AbstractHolidayCalendar(name="USTradingCalendar", 
+                                       rules=[USMartinLutherKingJr,
+                                              USPresidentsDay,
+                                              GoodFriday,
+                                              USMemorialDay,
+                                              Holiday("Juneteenth", month=6, day=19),
+                                              Holiday('IndependenceDay', month=7, day=4, observance=nearest_workday),
+                                              #USLaborDay,
+                                              USThanksgivingDay,
+                                              Holiday('Christmas', month=12, day=25, observance=nearest_workday),
+                                              Holiday('NewYearsEve', month=1, day=1, observance=nearest_workday)])
+
+    return _CAL
+
+CST = ZoneInfo("America/Chicago")
+
+@functools.lru_cache(maxsize=64)
+def _holidaysRange(startYear : int, endYear : int) -> np.ndarray:
+    '''
+    
+    US trading holidays for the whole calendar years `startYear` through 
+    `endYear`, as a sorted (read-only) datetime64[D] array. Cached, as
+    evaluating the calendar rules is far more expensive than the day counts
+    that use them.
+
+    '''
+    holidays = _getCal().holidays(datetime.datetime(startYear, 1, 1), 
+                                  datetime.datetime(endYear, 12, 31)).to_numpy(dtype="datetime64[D]")
+    holidays.flags.writeable = False
+
+    return holidays
+
+# precomputed window covering typical contract lifetimes, built on first use
+_HOLIDAY_YEARS = (1990, 2050)
+_HOLIDAYS : np.ndarray | None = None
+_HOLIDAY_SET : frozenset = frozenset()
 
-CAL = USTradingCalendar()
-CST = pytz.timezone("CST6CDT")
+def _getHolidays() -> np.ndarray:
+    '''
+    
+    The precomputed `_HOLIDAY_YEARS` holidays (also filling `_HOLIDAY_SET`).
+
+    '''
+    global _HOLIDAYS, _HOLIDAY_SET
+
+    if _HOLIDAYS is None:
+        _HOLIDAYS = _holidaysRange(*_HOLIDAY_YEARS)
+        _HOLIDAY_SET = frozenset(_HOLIDAYS.tolist())
+
+    return _HOLIDAYS
+
+def _isHoliday(date : datetime.date) -> bool:
+    '''
+    
+    Whether `date` is a US trading holiday. O(1) set lookup within the 
+    precomputed window, cached yearly holidays otherwise.
+
+    '''
+    if _HOLIDAY_YEARS[0] <= date.year <= _HOLIDAY_YEARS[1]:
+        _getHolidays()
+        return date in _HOLIDAY_SET
+
+    return np.datetime64(date, "D") in _holidaysRange(date.year, date.year)
+
+def _holidays(start : datetime.datetime, end : datetime.datetime) -> np.ndarray:
+    '''
+    
+    US trading holidays falling between the dates of `start` and `end` 
+    (inclusive), sliced from the precomputed / cached yearly holidays.
+
+    '''
+    if (_HOLIDAY_YEARS[0] <= start.year) and (end.year <= _HOLIDAY_YEARS[1]):
+        holidays = _getHolidays()
+    else:
+        holidays = _holidaysRange(start.year, end.year)
+
+    first = np.searchsorted(holidays, np.datetime64(start.date(), "D"), side="left")
+    last = np.searchsorted(holidays, np.datetime64(end.date(), "D"), side="right")
+
+    return holidays[first:last]
+
+# trading sessions per weekday (Monday = 0), as (open, close) seconds of the CST day
+_SESSIONS = (((0, 57600), (61200, 86400)), # 0000 - 1600, 1700 - 2359
+             ((0, 57600), (61200, 86400)),
+             ((0, 57600), (61200, 86400)),
+             ((0, 57600), (61200, 86400)),
+             ((0, 57600),),                # Friday, 0000 - 1600
+             (),                           # Saturday, closed
+             ((61200, 86400),))            # Sunday, 1700 - 2359
 
-def trading_TS(start : datetime.datetime, end : datetime.datetime):
+# trading seconds in a full day, per weekday
+_DAILY_SECS = tuple(sum(sessionClose - sessionOpen for sessionOpen, sessionClose in sessions) for sessions in _SESSIONS)
+
+def _secondOfDay(dateTime : datetime.datetime) -> float:
+    return dateTime.hour * 3600 + dateTime.minute * 60 + dateTime.second + dateTime.microsecond / 1e6
+
+def _sessionSeconds(weekday : int, startSecond : float, endSecond : float) -> float:
+    '''
+    
+    Trading seconds between two seconds of the same CST day: the overlap of
+    [startSecond, endSecond] with each of that weekday's sessions.
+
+    '''
+    total = 0.0
+    for sessionOpen, sessionClose in _SESSIONS[weekday]:
+        total += max(0, min(endSecond, sessionClose) - max(startSecond, sessionOpen))
+
+    return total
+
+def _sameDayHandler(weekday : int) -> Callable[[datetime.datetime, datetime.datetime], float]:
+    '''
+    
+    Generates the same-day `trading_seconds()` calculation for `weekday`, 
+    with that weekday's sessions unrolled as constants (and no-op bounds at 
+    the start / end of the day dropped) so no session lookups or weekday 
+    comparisons remain at call time.
+
+    '''
+    terms = []
+    for sessionOpen, sessionClose in _SESSIONS[weekday]:
+        closeTerm = "endSecond" if sessionClose == 86400 else f"min(endSecond, {sessionClose})"
+        openTerm = "startSecond" if sessionOpen == 0 else f"max(startSecond, {sessionOpen})"
+        terms.append(f"max(0, {closeTerm} - {openTerm})")
+
+    source = (f"def _sameDay{weekday}(start, end):\n"
+              f"    startSecond = start.hour * 3600 + start.minute * 60 + start.second + start.microsecond / 1e6\n"
+              f"    endSecond = end.hour * 3600 + end.minute * 60 + end.second + end.microsecond / 1e6\n"
+              f"    return {' + '.join(terms) or '0'}\n")
+
+    namespace : dict = {}
+    exec(source, namespace)
+
+    return namespace[f"_sameDay{weekday}"]
+
+# same-day handlers per weekday (Monday = 0)
+_SAMEDAY_HANDLERS = tuple(_sameDayHandler(weekday) for weekday in range(7))
+
+_OPEN_0930 = datetime.time(9, 30)
+
+def trading_TS(start : datetime.datetime, end : datetime.datetime) -> float:
     '''
 
     "TS" = "Tenor Simple": Counts the number of business days until a 
@@ -596,23 +1267,20 @@ def trading_TS(start : datetime.datetime, end : datetime.datetime):
     if newStart.hour >= 16:
         newStart += datetime.timedelta(days=1)
     
-    if (newEnd <= newEnd.replace(hour=9, minute=30, second=0, microsecond=0)):
+    if newEnd.time() <= _OPEN_0930:
         newEnd -= datetime.timedelta(days=1)
 
     # business day count is start inclusive and end exclusive (adding 1).
     tradingDays = np.busday_count(newStart.date(), 
                                   newEnd.date() + datetime.timedelta(days=1), 
-                                  holidays=np.array(CAL.holidays(newStart.replace(hour=0, minute=0, second=0, microsecond=0), 
-                                                                 newEnd), 
-                                                                 dtype="datetime64[D]"))
+                                  holidays=_holidays(newStart, newEnd))
 
     # get count for next year of trading days
-    DIY = 366 if calendar.isleap(newStart.year) else 365
+    DIY = 366 if _isLeap(newStart.year) else 365
     oneYearAhead = newStart + datetime.timedelta(days=DIY)
     yearlyTradingDays = np.busday_count(newStart.date(), 
                                         oneYearAhead.date(), 
-                                        holidays=np.array(CAL.holidays(newStart.replace(hour=0, minute=0, second=0, microsecond=0), 
-                                                                       oneYearAhead), dtype="datetime64[D]"))
+                                        holidays=_holidays(newStart, oneYearAhead))
 
     return tradingDays / yearlyTradingDays
 
@@ -642,119 +1310,52 @@ def trading_seconds(start : datetime.datetime | None = None, end : datetime.date
     '''
 
     # default start
-    if isinstance(start, NoneType):
+    if start is None:
         start = datetime.datetime.now(tz=datetime.UTC)
 
     # default end (one year from start)
-    if isinstance(end, NoneType):
-        DIY = 366 if calendar.isleap(start.year) else 365
+    if end is None:
+        DIY = 366 if _isLeap(start.year) else 365
         end = start + datetime.timedelta(DIY)
 
     # adjusted timezone for calendar filters
     newStart = start.astimezone(CST)
     newEnd = end.astimezone(CST)
-    holidays = CAL.holidays(newStart.replace(hour=0, minute=0, second=0, microsecond=0), newEnd).to_numpy(dtype="datetime64[D]")
+
+    # empty / reversed period
+    if newStart >= newEnd:
+        return 0.0
+
+    # calendar dates, built once and reused below
+    startDate = newStart.date()
+    endDate = newEnd.date()
 
     # catch same day start / end
-    if newStart.date() == newEnd.date():
-
-        # Sundays, limit market to open
-        if newStart.weekday() == 6:
-            if newEnd.hour >= 17:
-                totalSeconds = (newEnd - max(newStart, newStart.replace(hour=17, minute=0, second=0, microsecond=0))).total_seconds()
-            else:
-                totalSeconds = 0
-        
-        # Weekdays, handle as usual and subtract closed hours
-        elif newStart.weekday() in [0, 1, 2, 3]:
-            
-            # either ends before 1600 or starts after 1700
-            if (newEnd.hour < 16) or (newStart.hour >= 17):
-                totalSeconds = (newEnd - newStart).total_seconds()
-            
-            # starts and ends during close
-            elif (newStart.hour == 16) and (newEnd.hour == 16):
-                totalSeconds = 0
-
-            # starts during close, shift to open
-            elif newStart.hour == 16:
-                totalSeconds = (newEnd - newStart.replace(hour=17, minute=0, second=0, microsecond=0)).total_seconds()
-            
-            # ends during close, shift to close
-            elif newEnd.hour == 16:
-                totalSeconds = (newEnd.replace(hour=16, minute=0, second=0, microsecond=0) - newStart).total_seconds()
-
-            elif (newStart.hour < 16) and (newEnd.hour >= 17):
-                totalSeconds = ( newEnd - newStart - datetime.timedelta(hours=1) ).total_seconds()
-
-        # Fridays, limit market to close
-        elif newStart.weekday() == 4:
-            if newStart.hour < 16:
-                totalSeconds = (min(newEnd.replace(hour=16, minute=0, second=0, microsecond=0), newEnd) - newStart).total_seconds()
-            else:
-                totalSeconds = 0
+    if startDate == endDate:
+        totalSeconds = _SAMEDAY_HANDLERS[startDate.weekday()](newStart, newEnd)
     
     # otherwise, multi-day period
     else:
         # np.busday_count() formatting:
-        startDate = newStart.date()
-        endDate = (newEnd + datetime.timedelta(days=1)).date() # np.busday_count() is exclusive of end date
+        holidays = _holidays(newStart, newEnd)
+        busdayEnd = endDate + datetime.timedelta(days=1) # np.busday_count() is exclusive of end date
 
-        weekdays = np.busday_count(startDate, endDate, weekmask="1111000", holidays=holidays)
-        fridays = np.busday_count(startDate, endDate, weekmask="0000100", holidays=holidays)
-        sundays = np.busday_count(startDate, endDate, weekmask="0000001", holidays=holidays)
+        weekdays = np.busday_count(startDate, busdayEnd, weekmask="1111000", holidays=holidays)
+        fridays = np.busday_count(startDate, busdayEnd, weekmask="0000100", holidays=holidays)
+        sundays = np.busday_count(startDate, busdayEnd, weekmask="0000001", holidays=holidays)
 
         # count seconds
-        totalSeconds = weekdays * 82800 # 0000 - 1600, 1700 - 2359
-        totalSeconds += fridays * 57600 # 0000 - 1600
-        totalSeconds += sundays * 25200 # 1700 - 2359
-
-        # adjust back for start time
-        if newStart.replace(hour=0, minute=0, second=0, microsecond=0) not in holidays:
-            if newStart.weekday() == 6:
-                if newStart.hour >= 17:
-                    nextDay = (newStart + datetime.timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-                    totalSeconds -= (25200 - (nextDay - newStart).total_seconds())
-
-            elif newStart.weekday() in [0, 1, 2, 3]:
-                if newStart.hour >= 17:
-                    nextDay = (newStart + datetime.timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-                    totalSeconds -= (82800 - (nextDay - newStart).total_seconds())
-
-                elif newStart.hour == 16:
-                    totalSeconds -= 57600
-
-                elif newStart.hour < 16:
-                    nextDay = (newStart + datetime.timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-                    totalSeconds -= (86400 - (nextDay - newStart).total_seconds()) # added 1h back: 82800 -> 86400
-            
-            elif newStart.weekday() == 4:
-                if newStart.hour < 16:
-                    totalSeconds -= (57600 - (newStart.replace(hour=16, minute=0, second=0, microsecond=0) - newStart).total_seconds())
-                else:
-                    totalSeconds -= 57600
+        totalSeconds = float(weekdays * _DAILY_SECS[0] + # 0000 - 1600, 1700 - 2359
+                             fridays * _DAILY_SECS[4] +  # 0000 - 1600
+                             sundays * _DAILY_SECS[6])   # 1700 - 2359
+
+        # adjust back for start time (sessions before start)
+        if not _isHoliday(startDate):
+            totalSeconds -= _sessionSeconds(startDate.weekday(), 0, _secondOfDay(newStart))
         
-        # adjust back for end time
-        if newEnd.replace(hour=0, minute=0, second=0, microsecond=0) not in holidays:
-            if newEnd.weekday() == 6:
-                if newEnd.hour >= 17:
-                    totalSeconds -= (25200 - (newEnd - newEnd.replace(hour=17, minute=0, second=0, microsecond=0)).total_seconds())
-                else:
-                    totalSeconds -= 25200
-                
-            elif newEnd.weekday() in [0, 1, 2, 3]:
-                if newEnd.hour >= 17:
-                    totalSeconds -= (86400 - (newEnd - newEnd.replace(hour=0, minute=0, second=0, microsecond=0)).total_seconds()) # added 1h back: 82800 -> 86400
-
-                elif newEnd.hour == 16:
-                    totalSeconds -= 25200
-                
-                elif newEnd.hour < 16:
-                    totalSeconds -= (82800 - (newEnd - newEnd.replace(hour=0, minute=0, second=0, microsecond=0)).total_seconds())
-            
-            else:
-                if newEnd.hour < 16:
-                    totalSeconds -= (57600 - (newEnd - newEnd.replace(hour=0, minute=0, second=0, microsecond=0)).total_seconds())
+        # adjust back for end time (sessions after end)
+        if not _isHoliday(endDate):
+            totalSeconds -= _sessionSeconds(endDate.weekday(), _secondOfDay(newEnd), 86400)
 
     return totalSeconds
 
@@ -787,7 +1388,30 @@ def trading_days(start : datetime.datetime | None = None, end : datetime.datetim
     # divide by 23 hours in day vs 24 to adjust for 1h close
     return trading_seconds(start, end) / (23 * 60 * 60)
 
-def trading_T(start : datetime.datetime, end : datetime.datetime):
+@functools.lru_cache(maxsize=1024)
+def _yearlySeconds(start : datetime.datetime, 
+                   tzinfo : datetime.tzinfo | None, 
+                   fold : int) -> float:
+    '''
+    
+    Cached `trading_seconds(start)`, the denominator of `trading_T()`. Curves
+    of tenors share a start, so it would otherwise be recalculated for every
+    tenor. `tzinfo` and `fold` are only part of the cache key: aware 
+    datetimes hash by instant, but the default end (`start` + DIY) is wall 
+    clock time, so equal instants in timezones with different DST rules (or 
+    either side of a DST fold) can give different yearly seconds.
+
+    >>> utc = datetime.datetime(2024, 3, 30, 12, tzinfo=datetime.timezone.utc)
+    >>> london = utc.astimezone(ZoneInfo("Europe/London"))
+    >>> _yearlySeconds(utc, utc.tzinfo, utc.fold) == trading_seconds(utc)
+    True
+    >>> _yearlySeconds(london, london.tzinfo, london.fold) == trading_seconds(london)
+    True
+
+    '''
+    return trading_seconds(start)
+
+def trading_T(start : datetime.datetime, end : datetime.datetime) -> float:
     '''
 
     Calculates tenor of currency futures (or options) contracts, accounting
@@ -813,8 +1437,144 @@ def trading_T(start : datetime.datetime, end : datetime.datetime):
 
     '''
 
+    # zero-length period
+    if end == start:
+        return 0.0
+
     # trading seconds in period / trading seconds in upcoming year
-    return trading_seconds(start, end) / trading_seconds(start)
+    return trading_seconds(start, end) / _yearlySeconds(start, start.tzinfo, start.fold)
+
+''' CUSTOM BATCH METHODS '''
+# _SESSIONS as a (weekday, session, open/close) array, closed sessions padded as (0, 0)
+_SESSION_TABLE = np.array([list(sessions) + [(0, 0)] * (2 - len(sessions)) for sessions in _SESSIONS])
+
+def _sessionSecondsBatch(weekday : np.ndarray, 
+                         startSecond : np.ndarray | float, 
+                         endSecond : np.ndarray | float) -> np.ndarray:
+    '''
+    
+    Array equivalent of `_sessionSeconds()`.
+
+    '''
+    sessions = _SESSION_TABLE[weekday]
+    overlap = np.minimum(np.asarray(endSecond)[..., None], sessions[..., 1]) - \
+              np.maximum(np.asarray(startSecond)[..., None], sessions[..., 0])
+
+    return np.maximum(overlap, 0).sum(axis=-1)
+
+def _toCSTBatch(dates : np.ndarray) -> np.ndarray:
+    '''
+    
+    Converts UTC datetime64 values to CST wall clock datetime64 values.
+
+    '''
+    import pandas as pd
+
+    index = pd.DatetimeIndex(dates.ravel()).tz_localize("UTC").tz_convert(CST).tz_localize(None)
+
+    return index.to_numpy(dtype="datetime64[us]").reshape(dates.shape)
+
+def trading_seconds_batch(start : np.ndarray, end : np.ndarray | None = None) -> np.ndarray:
+    '''
+    
+    Vectorized `trading_seconds()`.
+
+    *note* Converts datetimes provided to CST for US holiday filtering, removing
+    1 hour from every 24h trading day for market close between 1600-1700 CST.
+    
+    Parameters
+    ----------
+    `start` : np.ndarray
+        The dates to begin counting from (inclusive), as UTC datetime64 values
+        (any unit). A single value is broadcast against `end`.
+
+    `end` : np.ndarray | None = None
+        The dates to count up to (inclusive), as UTC datetime64 values (any 
+        unit). If None (default), will use 1 year ahead of each start date.
+    
+    Returns
+    -------
+    `np.ndarray`
+        The number of seconds in each upcoming trading period specified.
+
+    '''
+    start = _asDatetime64(start)
+
+    # default end (one year from start)
+    if end is None:
+        startYears = start.astype("datetime64[Y]").astype(np.int64) + 1970
+        end = start + np.where(_isLeap(startYears), 366, 365).astype("timedelta64[D]")
+
+    start, end = np.broadcast_arrays(start, _asDatetime64(end))
+
+    # adjusted timezone for calendar filters
+    newStart = _toCSTBatch(start)
+    newEnd = _toCSTBatch(end)
+
+    startDate = newStart.astype("datetime64[D]")
+    endDate = newEnd.astype("datetime64[D]")
+    startSecond = (newStart - startDate) / np.timedelta64(1, "s")
+    endSecond = (newEnd - endDate) / np.timedelta64(1, "s")
+    startWeekday = (startDate.astype(np.int64) + 3) % 7 # 1970-01-01 was a Thursday
+    endWeekday = (endDate.astype(np.int64) + 3) % 7
+
+    if startDate.size == 0:
+        return np.zeros(startDate.shape)
+
+    # holidays covering every date involved
+    years = np.concatenate([startDate.ravel(), endDate.ravel()]).astype("datetime64[Y]").astype(np.int64) + 1970
+    holidays = _holidaysRange(int(years.min()), int(years.max()))
+
+    # same day start / end
+    sameDaySeconds = _sessionSecondsBatch(startWeekday, startSecond, endSecond)
+
+    # multi-day period, np.busday_count() is exclusive of end date
+    weekdays = np.busday_count(startDate, endDate + 1, weekmask="1111000", holidays=holidays)
+    fridays = np.busday_count(startDate, endDate + 1, weekmask="0000100", holidays=holidays)
+    sundays = np.busday_count(startDate, endDate + 1, weekmask="0000001", holidays=holidays)
+
+    totalSeconds = weekdays * _DAILY_SECS[0] + fridays * _DAILY_SECS[4] + sundays * _DAILY_SECS[6]
+
+    # adjust back for start / end times on non-holidays
+    totalSeconds = totalSeconds - np.where(np.isin(startDate, holidays), 0, 
+                                           _sessionSecondsBatch(startWeekday, 0, startSecond))
+    totalSeconds = totalSeconds - np.where(np.isin(endDate, holidays), 0, 
+                                           _sessionSecondsBatch(endWeekday, endSecond, 86400))
+
+    totalSeconds = np.where(startDate == endDate, sameDaySeconds, totalSeconds)
+
+    # empty / reversed periods
+    return np.where(newStart >= newEnd, 0.0, totalSeconds)
+
+def trading_T_batch(start : np.ndarray, end : np.ndarray) -> np.ndarray:
+    '''
+
+    Vectorized `trading_T()`. When a single `start` is given (ie. a curve of 
+    tenors), the yearly trading seconds are only calculated once.
+    
+    Parameters
+    ----------
+    `start` : np.ndarray
+        The "current" dates/times from the contracts' point of view, as UTC
+        datetime64 values (any unit). A single value is broadcast against 
+        `end`.
+
+    `end` : np.ndarray
+        The expirations / settlements / maturities of the contracts, as UTC
+        datetime64 values (any unit).
+
+    Returns
+    -------
+    `np.ndarray`
+        The length of time until each contract's expiration, expressed as a 
+        fraction of a year.
+
+    '''
+
+    # trading seconds in period / trading seconds in upcoming year
+    result = trading_seconds_batch(start, end) / trading_seconds_batch(start)
+
+    return _zeroLengthBatch(_asDatetime64(start), _asDatetime64(end), result)
 
 
 